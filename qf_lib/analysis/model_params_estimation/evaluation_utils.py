@@ -16,6 +16,8 @@ from datetime import datetime
 from math import sqrt
 from typing import Sequence
 
+import numpy as np
+
 from qf_lib.backtesting.fast_alpha_model_tester.backtest_summary import BacktestSummary
 from qf_lib.common.enums.frequency import Frequency
 from qf_lib.common.tickers.tickers import Ticker
@@ -29,15 +31,18 @@ class BacktestSummaryEvaluator:
         self.backtest_summary = backtest_summary
 
         self.params_backtest_summary_elem_dict = defaultdict(list)
+        # Index the elements by parameters and tickers, to avoid scanning all elements on every evaluation
+        self._params_and_tickers_to_elems = {}
         for elem in backtest_summary.elements_list:
             self.params_backtest_summary_elem_dict[elem.model_parameters].append(elem)
+            params_and_tickers = (elem.model_parameters, frozenset(elem.tickers))
+            self._params_and_tickers_to_elems.setdefault(params_and_tickers, []).append(elem)
 
     def evaluate_params_for_tickers(self, parameters: tuple, tickers: Sequence[Ticker], start_time: datetime,
                                     end_date: datetime):
 
         # Get the backtest element for the given list of tickers
-        backtest_elements_for_tickers = [el for el in self.params_backtest_summary_elem_dict[parameters]
-                                         if set(el.tickers) == set(tickers)]
+        backtest_elements_for_tickers = self._params_and_tickers_to_elems.get((parameters, frozenset(tickers)), [])
         assert len(backtest_elements_for_tickers) == 1, "Check if the modeled_params passed to " \
                                                         "FastAlphaModelTesterConfig match those you want to test"
         backtest_elem = backtest_elements_for_tickers[0]
@@ -61,11 +66,12 @@ class BacktestSummaryEvaluator:
             # Do not compute further fields - return the default None values
             return ticker_evaluation
 
-        avg_nr_of_trades = avg_nr_of_trades_per1y(QFSeries([t for t in trades if t.start_time >= start_date
-                                                            and t.end_time <= end_date]), start_date, end_date)
+        # Filter the trades only once and compute all the statistics on the same series of their pnl values
+        trades_pnl = QFSeries(np.array([t.pnl for t in trades if t.start_time >= start_date and t.end_time <= end_date],
+                                       dtype=np.float64))
+        avg_nr_of_trades = avg_nr_of_trades_per1y(trades_pnl, start_date, end_date)
         ticker_evaluation.avg_nr_of_trades_1Y = avg_nr_of_trades
-        ticker_evaluation.sqn_per_avg_nr_trades = sqn(QFSeries([t.pnl for t in trades if t.start_time >= start_date
-                                                                and t.end_time <= end_date])) * sqrt(avg_nr_of_trades)
+        ticker_evaluation.sqn_per_avg_nr_trades = sqn(trades_pnl) * sqrt(avg_nr_of_trades)
 
         returns_tms = returns_tms.loc[start_date:end_date]
         if not returns_tms.empty:
@@ -75,6 +81,9 @@ class BacktestSummaryEvaluator:
 
 
 class TradesEvaluationResult:
+    __slots__ = ("ticker", "parameters", "sqn_per_avg_nr_trades", "avg_nr_of_trades_1Y", "annualised_return",
+                 "start_date", "end_date")
+
     def __init__(self):
         self.ticker = None
         self.parameters = None
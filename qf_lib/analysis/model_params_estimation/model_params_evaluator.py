@@ -195,17 +195,7 @@ class ModelParamsEvaluationDocument:
         title_to_grid = defaultdict(lambda: GridElement(mode=PlottingMode.PDF, figsize=self.image_size))
         for start_time, end_time in [(self.backtest_summary.start_date, self.out_of_sample_start_date),
                                      (self.out_of_sample_start_date, self.backtest_summary.end_date)]:
-            results = QFDataFrame()
-
-            for param_tuple in parameters_list:
-                trades_eval_result = self.backtest_evaluator.evaluate_params_for_tickers(param_tuple, tickers,
-                                                                                         start_time, end_time)
-                row, column = param_tuple
-                results.loc[row, column] = trades_eval_result
-
-            results.sort_index(axis=0, inplace=True, ascending=False)
-            results.sort_index(axis=1, inplace=True)
-            results.fillna(TradesEvaluationResult(), inplace=True)
+            results = self._evaluate_params_grid(parameters_list, tickers, start_time, end_time)
 
             sqn_avg_nr_trades = results.applymap(lambda x: x.sqn_per_avg_nr_trades).fillna(0)
             avg_nr_of_trades = results.applymap(lambda x: x.avg_nr_of_trades_1Y).fillna(0)
@@ -237,6 +227,29 @@ class ModelParamsEvaluationDocument:
             self.document.add_element(HeadingElement(3, "{} - {}".format(description, tickers_used)))
             self.document.add_element(grid)
 
+    def _evaluate_params_grid(self, parameters_list: Sequence[tuple], tickers: Sequence[Ticker],
+                              start_time: datetime, end_time: datetime) -> QFDataFrame:
+        """
+        Evaluates all 2-element parameters tuples and returns the TradesEvaluationResults in a data frame, indexed by
+        the first parameter (sorted descending) and with columns corresponding to the second parameter. Combinations
+        of parameters which were not tested are filled with empty TradesEvaluationResults.
+        """
+        # Collect the results first and create the data frame at once, as enlarging the data frame cell by cell
+        # reallocates it with every new row or column
+        column_to_results = defaultdict(dict)
+
+        for param_tuple in parameters_list:
+            trades_eval_result = self.backtest_evaluator.evaluate_params_for_tickers(param_tuple, tickers,
+                                                                                     start_time, end_time)
+            row, column = param_tuple
+            column_to_results[column][row] = trades_eval_result
+
+        results = QFDataFrame(column_to_results)
+        results.sort_index(axis=0, inplace=True, ascending=False)
+        results.sort_index(axis=1, inplace=True)
+        results.fillna(TradesEvaluationResult(), inplace=True)
+        return results
+
     def _create_single_heat_map(self, title, result_df, min_v, max_v):
         chart = HeatMapChart(data=result_df, color_map=plt.get_cmap("coolwarm"))
         chart.add_decorator(AxisTickLabelsDecorator(labels=list(result_df.columns), axis=Axis.X))
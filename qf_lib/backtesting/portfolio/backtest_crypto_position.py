@@ -11,7 +11,6 @@
 #     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
-from numpy import sign
 from math import isclose
 
 from qf_lib.backtesting.portfolio.backtest_position import BacktestPosition
@@ -31,7 +30,7 @@ class BacktestCryptoPosition(BacktestPosition):
         return -result
 
     def _compute_profit_and_loss_fraction(self, price: float, quantity: float):
-        if sign(quantity) * self.direction() == -1:
+        if quantity * self._direction < 0:
             price_pnl = price - self._avg_price_per_unit
             # We multiply by the direction, so that the in case of finding a pair of transaction going in opposite
             # directions, the realized pnl of this operation would consider the direction of the position
@@ -50,17 +49,18 @@ class BacktestCryptoPosition(BacktestPosition):
             self.start_time = transaction.transaction_fill_time
 
         if self._direction == 0:
-            self._direction = sign(transaction.quantity)
+            self._direction = 1 if transaction.quantity > 0 else -1
 
-        sign_change = sign(self._quantity) * sign(self._quantity + transaction.quantity)
-        assert sign_change != -1, "Position cannot change direction (for ex: from Long to Short). Close it first"
+        new_quantity = self._quantity + transaction.quantity
+        changes_direction = self._quantity > 0 > new_quantity or self._quantity < 0 < new_quantity
+        assert not changes_direction, "Position cannot change direction (for ex: from Long to Short). Close it first"
 
         # has to be called before we append the transaction to list of all transactions
         cash_move = self._cash_to_buy_or_proceeds_from_sale(transaction)
         self._realised_pnl_without_commissions += self._compute_profit_and_loss_fraction(price=transaction.price,
                                                                                          quantity=transaction.quantity)
 
-        if sign(transaction.quantity) == self.direction():
+        if transaction.quantity * self._direction > 0:
             self._avg_price_per_unit = (self._avg_price_per_unit * self._quantity + transaction.price *
                                         transaction.quantity) / (self._quantity + transaction.quantity)
 
@@ -11,7 +11,6 @@
 #     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
-from numpy import sign
 
 from qf_lib.backtesting.portfolio.backtest_position import BacktestPosition
 from qf_lib.backtesting.portfolio.transaction import Transaction
@@ -29,7 +28,7 @@ class BacktestEquityPosition(BacktestPosition):
         return -result
 
     def _compute_profit_and_loss_fraction(self, price: float, quantity: int):
-        if sign(quantity) * self.direction() == -1:
+        if quantity * self._direction < 0:
             price_pnl = price - self._avg_price_per_unit
             # We multiply by the direction, so that the in case of finding a pair of transaction going in opposite
             # directions, the realized pnl of this operation would consider the direction of the position
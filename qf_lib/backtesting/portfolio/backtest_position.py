@@ -15,8 +15,6 @@ from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from typing import Optional
 
-from numpy import sign
-
 from qf_lib.backtesting.portfolio.position import Position
 from qf_lib.backtesting.portfolio.transaction import Transaction
 from qf_lib.common.tickers.tickers import Ticker
@@ -145,17 +143,18 @@ class BacktestPosition(Position, metaclass=ABCMeta):
             self.start_time = transaction.transaction_fill_time
 
         if self._direction == 0:
-            self._direction = sign(transaction.quantity)
+            self._direction = 1 if transaction.quantity > 0 else -1
 
-        sign_change = sign(self._quantity) * sign(self._quantity + transaction.quantity)
-        assert sign_change != -1, "Position cannot change direction (for ex: from Long to Short). Close it first"
+        new_quantity = self._quantity + transaction.quantity
+        changes_direction = self._quantity > 0 > new_quantity or self._quantity < 0 < new_quantity
+        assert not changes_direction, "Position cannot change direction (for ex: from Long to Short). Close it first"
 
         # has to be called before we append the transaction to list of all transactions
         cash_move = self._cash_to_buy_or_proceeds_from_sale(transaction)
         self._realised_pnl_without_commissions += self._compute_profit_and_loss_fraction(price=transaction.price,
                                                                                          quantity=transaction.quantity)
 
-        if sign(transaction.quantity) == self.direction():
+        if transaction.quantity * self._direction > 0:
             self._avg_price_per_unit = (self._avg_price_per_unit * self._quantity + transaction.price *
                                         transaction.quantity) / (self._quantity + transaction.quantity)
 
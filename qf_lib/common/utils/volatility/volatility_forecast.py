@@ -12,12 +12,15 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
+from math import sqrt
+
+import numpy as np
 from arch.univariate import ConstantMean, Normal
 from arch.univariate.volatility import VolatilityProcess
+from joblib import Parallel, delayed
 
 from qf_lib.common.enums.frequency import Frequency
 from qf_lib.common.utils.miscellaneous.annualise_with_sqrt import annualise_with_sqrt
-from qf_lib.containers.series.log_returns_series import LogReturnsSeries
 from qf_lib.containers.series.qf_series import QFSeries
 
 
@@ -62,7 +65,7 @@ class VolatilityForecast:
         self.returns_tms = returns_tms.to_log_returns()
         self.forecasted_volatility = None  # will be assigned after calling one of the calculation methods
 
-    def calculate_timeseries(self, window_len: int, multiplier: int = 1) -> QFSeries:
+    def calculate_timeseries(self, window_len: int, multiplier: int = 1, n_jobs: int = 1) -> QFSeries:
         """
         Calculates volatility forecast for single asset. It is expressed in the frequency of returns.
         Value is calculated based on the configuration as in the object attributes. The result of the calculation
@@ -76,6 +79,9 @@ class VolatilityForecast:
             ex. 100 (should be > 1)
             improves the optimization performance, as for very small values the results may be faulty;
             after optimization the results are scaled back (division by multiplier value)
+        n_jobs: int
+            number of jobs/cores used to fit the models of the consecutive rolling windows in parallel
+            (-1 uses all available cores)
 
         Returns
         -------
@@ -85,16 +91,26 @@ class VolatilityForecast:
 
         assert self.forecasted_volatility is None, "The forecast was already calculated."
         assert window_len is not None, "For timeseries calculation the rolling window length must be specified."
+        assert window_len > 0, "The rolling window length must be positive."
         self.window_len = window_len
         assert multiplier >= 1
 
-        returns_tms = self.returns_tms * multiplier
-        volatility_tms = returns_tms.rolling_window(window_len, self._calculate_single_value)
-        volatility_tms = volatility_tms.dropna()
-        volatility_tms = volatility_tms / multiplier
+        returns_values = self.returns_tms.values * multiplier
+        # each window is fitted independently, so the fits may be distributed between multiple processes
+        windows = (returns_values[end - window_len + 1:end + 1] for end in range(window_len - 1, len(returns_values)))
+        volatility_values = Parallel(n_jobs=n_jobs)(
+            delayed(_forecast_single_volatility)(window, self.vol_process, self.method, self.horizon)
+            for window in windows
+        )
 
+        # rescale and annualise the raw values, so that the resulting series is created only once
+        volatility_values = np.asarray(volatility_values, dtype=np.float64) / multiplier
         if self.annualise:
-            volatility_tms = annualise_with_sqrt(volatility_tms, self.frequency)
+            volatility_values *= sqrt(self.frequency.occurrences_in_year)
+
+        is_valid = ~np.isnan(volatility_values)
+        volatility_index = self.returns_tms.index[window_len - 1:]
+        volatility_tms = QFSeries(data=volatility_values[is_valid], index=volatility_index[is_valid])
 
         self.forecasted_volatility = volatility_tms
         return volatility_tms
@@ -121,8 +137,8 @@ class VolatilityForecast:
         assert self.forecasted_volatility is None, "The forecast was already calculated."
         assert multiplier >= 1
 
-        returns_tms = self.returns_tms * multiplier
-        volatility_value = self._calculate_single_value(returns_tms)
+        returns_values = self.returns_tms.values * multiplier
+        volatility_value = self._calculate_single_value(returns_values)
         volatility_value = volatility_value / multiplier
 
         if self.annualise:
@@ -131,20 +147,33 @@ class VolatilityForecast:
         self.forecasted_volatility = volatility_value
         return volatility_value
 
-    def _calculate_single_value(self, returns: LogReturnsSeries) -> float:
-        am = self._get_ARCH_model(returns, self.vol_process)
-        res = am.fit(disp='off', show_warning=False)  # options={'maxiter': 10000, 'ftol': 1e-2})
-        forecasts = res.forecast(horizon=self.horizon, method=self.method)
-        column_str = 'h.{}'.format(self.horizon)  # take value for the selected horizon
-        forecasts_series = forecasts.variance[column_str]
-        # take the last value (most recent forecast)
-        forecasted_value = forecasts_series[-1]
-        # convert to volatility (if power=2, forecasted_value corresponds to variance, etc.)
-        forecasted_vol = forecasted_value ** (1 / float(am.volatility.power))
-        return forecasted_vol
-
-    def _get_ARCH_model(self, returns: LogReturnsSeries, vol_process: VolatilityProcess):
-        am = ConstantMean(returns)
-        am.volatility = vol_process
-        am.distribution = Normal()
-        return am
+    def _calculate_single_value(self, returns: np.ndarray) -> float:
+        return _forecast_single_volatility(returns, self.vol_process, self.method, self.horizon)
+
+    def _get_ARCH_model(self, returns: np.ndarray, vol_process: VolatilityProcess):
+        return _get_arch_model(returns, vol_process)
+
+
+def _forecast_single_volatility(returns: np.ndarray, vol_process: VolatilityProcess, method: str,
+                                horizon: int) -> float:
+    """
+    Fits the model to the given returns and returns the forecasted volatility for the given horizon. Defined on the
+    module level, so that only the returns window and the model configuration are sent to the parallel jobs.
+    """
+    am = _get_arch_model(returns, vol_process)
+    res = am.fit(disp='off', show_warning=False)  # options={'maxiter': 10000, 'ftol': 1e-2})
+    forecasts = res.forecast(horizon=horizon, method=method)
+    column_str = 'h.{}'.format(horizon)  # take value for the selected horizon
+    forecasts_series = forecasts.variance[column_str]
+    # take the last value (most recent forecast)
+    forecasted_value = forecasts_series.iloc[-1]
+    # convert to volatility (if power=2, forecasted_value corresponds to variance, etc.)
+    forecasted_vol = forecasted_value ** (1 / float(am.volatility.power))
+    return forecasted_vol
+
+
+def _get_arch_model(returns: np.ndarray, vol_process: VolatilityProcess):
+    am = ConstantMean(returns)
+    am.volatility = vol_process
+    am.distribution = Normal()
+    return am
@@ -0,0 +1,96 @@
+#     Copyright 2016-present CERN – European Organization for Nuclear Research
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+from unittest import TestCase
+
+from pandas import date_range
+
+from qf_lib.analysis.model_params_estimation.evaluation_utils import BacktestSummaryEvaluator
+from qf_lib.backtesting.alpha_model.alpha_model import AlphaModel
+from qf_lib.backtesting.fast_alpha_model_tester.backtest_summary import BacktestSummary, BacktestSummaryElement
+from qf_lib.backtesting.portfolio.trade import Trade
+from qf_lib.common.tickers.tickers import BloombergTicker
+from qf_lib.common.utils.dateutils.string_to_date import str_to_date
+from qf_lib.containers.series.simple_returns_series import SimpleReturnsSeries
+
+
+class TestBacktestSummaryEvaluator(TestCase):
+    def setUp(self):
+        self.ticker = BloombergTicker("Example Ticker")
+        self.start_date = str_to_date("2020-01-01")
+        self.end_date = str_to_date("2021-01-01")
+
+        dates = date_range(self.start_date, self.end_date, freq="D")
+        self.returns_tms = SimpleReturnsSeries(data=0.001, index=dates)
+
+        trades_pnl = [1.0, 2.0, 3.0, -1.0, float("nan")]
+        self.trades = [Trade(str_to_date("2020-02-01"), str_to_date("2020-03-01"), self.ticker, pnl, 0.0, 1)
+                       for pnl in trades_pnl]
+        # Trade finishing after the end date should not be taken into account
+        self.trades.append(Trade(str_to_date("2020-12-01"), str_to_date("2021-02-01"), self.ticker, 100.0, 0.0, 1))
+
+    def _create_evaluator(self, elements):
+        backtest_summary = BacktestSummary([self.ticker], AlphaModel, elements, self.start_date, self.end_date)
+        return BacktestSummaryEvaluator(backtest_summary)
+
+    def test_evaluate_params_for_tickers_statistics(self):
+        element = BacktestSummaryElement((1, 2), ("a", "b"), self.returns_tms, self.trades, [self.ticker])
+        evaluator = self._create_evaluator([element])
+
+        result = evaluator.evaluate_params_for_tickers((1, 2), [self.ticker], self.start_date, self.end_date)
+
+        # 5 trades within 366 days, the NaN pnl is skipped in the SQN
+        self.assertAlmostEqual(result.avg_nr_of_trades_1Y, 4.989651639344262)
+        self.assertAlmostEqual(result.sqn_per_avg_nr_trades, 1.6349396514655903)
+        self.assertEqual(result.start_date, self.start_date)
+        self.assertEqual(result.end_date, self.end_date)
+
+    def test_evaluate_params_for_tickers_selects_element(self):
+        other_ticker = BloombergTicker("Other Ticker")
+        both_tickers = [self.ticker, other_ticker]
+
+        elements = {
+            ((1, 2), (self.ticker,)): BacktestSummaryElement((1, 2), ("a", "b"), self.returns_tms, self.trades,
+                                                             [self.ticker]),
+            ((1, 2), (other_ticker,)): BacktestSummaryElement((1, 2), ("a", "b"), self.returns_tms, self.trades[:2],
+                                                              [other_ticker]),
+            ((1, 2), (self.ticker, other_ticker)): BacktestSummaryElement((1, 2), ("a", "b"), self.returns_tms,
+                                                                          self.trades[:3], both_tickers),
+            ((3, 4), (self.ticker,)): BacktestSummaryElement((3, 4), ("a", "b"), self.returns_tms, self.trades[:4],
+                                                             [self.ticker]),
+        }
+        evaluator = self._create_evaluator(list(elements.values()))
+
+        for (parameters, tickers), element in elements.items():
+            # The order of tickers should not matter
+            for tickers_order in (list(tickers), list(reversed(tickers))):
+                backtest_elem = evaluator._params_and_tickers_to_elems[(parameters, frozenset(tickers_order))]
+                self.assertEqual(backtest_elem, [element])
+
+                result = evaluator.evaluate_params_for_tickers(parameters, tickers_order, self.start_date,
+                                                               self.end_date)
+                self.assertEqual(result.parameters, parameters)
+                self.assertEqual(result.ticker, tickers_order)
+
+    def test_evaluate_params_for_tickers_missing_or_duplicated_element(self):
+        other_ticker = BloombergTicker("Other Ticker")
+        element = BacktestSummaryElement((1, 2), ("a", "b"), self.returns_tms, self.trades, [self.ticker])
+        duplicated_element = BacktestSummaryElement((3, 4), ("a", "b"), self.returns_tms, self.trades, [self.ticker])
+        evaluator = self._create_evaluator([element, duplicated_element, duplicated_element])
+
+        with self.assertRaises(AssertionError):
+            evaluator.evaluate_params_for_tickers((1, 2), [other_ticker], self.start_date, self.end_date)
+        with self.assertRaises(AssertionError):
+            evaluator.evaluate_params_for_tickers((5, 6), [self.ticker], self.start_date, self.end_date)
+        with self.assertRaises(AssertionError):
+            evaluator.evaluate_params_for_tickers((3, 4), [self.ticker], self.start_date, self.end_date)
@@ -0,0 +1,58 @@
+#     Copyright 2016-present CERN – European Organization for Nuclear Research
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+from unittest import TestCase
+from unittest.mock import Mock
+
+from qf_lib.analysis.model_params_estimation.evaluation_utils import TradesEvaluationResult
+from qf_lib.analysis.model_params_estimation.model_params_evaluator import ModelParamsEvaluationDocument
+from qf_lib.common.tickers.tickers import BloombergTicker
+from qf_lib.common.utils.dateutils.string_to_date import str_to_date
+
+
+class TestModelParamsEvaluationDocument(TestCase):
+    def setUp(self):
+        def evaluate_params_for_tickers(parameters, tickers, start_time, end_time):
+            result = TradesEvaluationResult()
+            result.parameters = parameters
+            result.ticker = tickers
+            return result
+
+        self.document = ModelParamsEvaluationDocument(Mock(), Mock())
+        self.document.backtest_evaluator = Mock()
+        self.document.backtest_evaluator.evaluate_params_for_tickers.side_effect = evaluate_params_for_tickers
+
+        self.tickers = [BloombergTicker("Example Ticker")]
+        self.start_time = str_to_date("2020-01-01")
+        self.end_time = str_to_date("2021-01-01")
+
+    def test_evaluate_params_grid_sparse(self):
+        parameters_list = [(1, 10), (1, 20), (2, 10), (3, 30)]
+
+        results = self.document._evaluate_params_grid(parameters_list, self.tickers, self.start_time, self.end_time)
+
+        self.assertEqual(list(results.index), [3, 2, 1])
+        self.assertEqual(list(results.columns), [10, 20, 30])
+        self.assertEqual(self.document.backtest_evaluator.evaluate_params_for_tickers.call_count, len(parameters_list))
+
+        for row in results.index:
+            for column in results.columns:
+                cell = results.loc[row, column]
+                self.assertIsInstance(cell, TradesEvaluationResult)
+                if (row, column) in parameters_list:
+                    self.assertEqual(cell.parameters, (row, column))
+                    self.assertEqual(cell.ticker, self.tickers)
+                else:
+                    # Combinations which were not tested are filled with empty results
+                    self.assertIsNone(cell.parameters)
+                    self.assertIsNone(cell.sqn_per_avg_nr_trades)
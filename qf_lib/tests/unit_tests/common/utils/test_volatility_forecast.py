@@ -0,0 +1,68 @@
+#     Copyright 2016-present CERN – European Organization for Nuclear Research
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+from unittest import TestCase
+
+import numpy as np
+from arch.univariate import ConstantMean, GARCH, Normal
+from pandas import date_range
+
+from qf_lib.common.utils.volatility.volatility_forecast import VolatilityForecast
+from qf_lib.containers.series.log_returns_series import LogReturnsSeries
+from qf_lib.tests.helpers.testing_tools.containers_comparison import assert_series_equal
+
+
+class TestVolatilityForecast(TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(5)
+        dates = date_range('2015-01-01', periods=80, freq='D')
+        self.log_returns_tms = LogReturnsSeries(data=random_state.normal(0.0, 0.01, len(dates)), index=dates)
+        self.window_len = 60
+        self.multiplier = 100
+
+    def _create_forecast(self):
+        return VolatilityForecast(self.log_returns_tms, GARCH(p=1, q=1), horizon=1, annualise=False)
+
+    def test_calculate_timeseries(self):
+        # Forecasts of the consecutive windows, computed one by one on the original series
+        forecast = self._create_forecast()
+        returns_tms = forecast.returns_tms * self.multiplier
+        expected_series = returns_tms.rolling_window(self.window_len, forecast._calculate_single_value)
+        expected_series = expected_series.dropna() / self.multiplier
+
+        actual_series = self._create_forecast().calculate_timeseries(self.window_len, self.multiplier)
+
+        self.assertEqual(len(actual_series), len(self.log_returns_tms) - self.window_len + 1)
+        self.assertTrue(actual_series.index.equals(self.log_returns_tms.index[self.window_len - 1:]))
+        assert_series_equal(expected_series, actual_series, absolute_tolerance=1e-10)
+
+    def test_calculate_timeseries_in_parallel(self):
+        single_job_series = self._create_forecast().calculate_timeseries(self.window_len, self.multiplier, n_jobs=1)
+        two_jobs_series = self._create_forecast().calculate_timeseries(self.window_len, self.multiplier, n_jobs=2)
+
+        assert_series_equal(single_job_series, two_jobs_series, absolute_tolerance=1e-10)
+
+    def test_calculate_single_forecast(self):
+        multiplier = 1000
+
+        # Direct fit of the arch model on the pandas series
+        am = ConstantMean(self.log_returns_tms * multiplier)
+        am.volatility = GARCH(p=1, q=1)
+        am.distribution = Normal()
+        res = am.fit(disp='off', show_warning=False)
+        expected_variance = res.forecast(horizon=1, method='analytic').variance['h.1'].iloc[-1]
+        expected_volatility = np.sqrt(expected_variance) / multiplier
+
+        actual_volatility = self._create_forecast().calculate_single_forecast(multiplier)
+
+        self.assertAlmostEqual(expected_volatility, actual_volatility, places=10)